@@ -1,9 +1,451 @@
+import array
+import random
+import sys
+from functools import lru_cache
+
+# Bitboard layout: square 'a1' is bit 0, 'b1' is bit 1, ..., 'h8' is bit 63.
+SQUARE_TO_BIT = {col + str(row): (row - 1) * 8 + file_index
+                 for row in range(1, 9)
+                 for file_index, col in enumerate('abcdefgh')}
+BIT_TO_SQUARE = [None] * 64
+for _square, _bit in SQUARE_TO_BIT.items():
+    BIT_TO_SQUARE[_bit] = _square
+
+def iter_bits(bb):
+    '''
+    Yields the square indices of the set bits in a bitboard, lowest first,
+    using the CPython-native least-significant-bit trick.
+    Parameters:
+        bb(int): bitboard
+    '''
+    while bb:
+        lsb = bb & -bb
+        yield lsb.bit_length() - 1
+        bb ^= lsb
+
+
+def popcount(bb):
+    '''
+    Returns the number of set bits in a bitboard.
+    Parameters:
+        bb(int): bitboard
+    '''
+    return bb.bit_count()
+
+
+def _build_step_attacks(offsets):
+    '''
+    Builds a 64-entry attack table for a piece that moves by fixed offsets
+    (knight or king). Each entry is a bitboard of reachable squares.
+    Parameters:
+        offsets(list): (rank_step, file_step) pairs
+    Returns:
+        list[int]: attack bitboard for each square index
+    '''
+    table = [0] * 64
+    for sq in range(64):
+        rank, file = divmod(sq, 8)
+        for rank_step, file_step in offsets:
+            new_rank, new_file = rank + rank_step, file + file_step
+            if 0 <= new_rank < 8 and 0 <= new_file < 8:
+                table[sq] |= 1 << (new_rank * 8 + new_file)
+    return table
+
+
+KNIGHT_ATTACKS = _build_step_attacks([(2, 1), (2, -1), (-2, 1), (-2, -1),
+                                      (1, 2), (1, -2), (-1, 2), (-1, -2)])
+KING_ATTACKS = _build_step_attacks([(1, 0), (-1, 0), (0, 1), (0, -1),
+                                    (-1, -1), (-1, 1), (1, -1), (1, 1)])
+
+_ROOK_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+_BISHOP_DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+def _slider_attacks(sq, directions, occupied):
+    '''
+    Walks each ray from a square until the first blocker (inclusive) and
+    returns the resulting attack bitboard. Used only to build the tables.
+    Parameters:
+        sq(int): square index 0..63
+        directions(list): (rank_step, file_step) pairs
+        occupied(int): occupancy bitboard
+    Returns:
+        int: attack bitboard
+    '''
+    attacks = 0
+    rank, file = divmod(sq, 8)
+    for rank_step, file_step in directions:
+        new_rank, new_file = rank + rank_step, file + file_step
+        while 0 <= new_rank < 8 and 0 <= new_file < 8:
+            bit = 1 << (new_rank * 8 + new_file)
+            attacks |= bit
+            if occupied & bit:
+                break
+            new_rank += rank_step
+            new_file += file_step
+    return attacks
+
+
+def _build_slider_tables(directions):
+    '''
+    Builds per-square blocker masks and attack tables for a sliding piece.
+    The mask for a square covers its rays minus the final edge square (an
+    edge blocker never changes the attack set). The table maps each possible
+    masked occupancy to its attack bitboard, so a lookup replaces the whole
+    ray walk at move time.
+    Parameters:
+        directions(list): (rank_step, file_step) pairs
+    Returns:
+        tuple: (list of 64 masks, list of 64 {masked_occupancy: attacks})
+    '''
+    masks = [0] * 64
+    tables = []
+    for sq in range(64):
+        rank, file = divmod(sq, 8)
+        mask = 0
+        for rank_step, file_step in directions:
+            ray = []
+            new_rank, new_file = rank + rank_step, file + file_step
+            while 0 <= new_rank < 8 and 0 <= new_file < 8:
+                ray.append(new_rank * 8 + new_file)
+                new_rank += rank_step
+                new_file += file_step
+            for ray_sq in ray[:-1]:
+                mask |= 1 << ray_sq
+        masks[sq] = mask
+        table = {}
+        subset = 0
+        while True:  # Enumerate every subset of the mask (Carry-Rippler)
+            table[subset] = _slider_attacks(sq, directions, subset)
+            subset = (subset - mask) & mask
+            if subset == 0:
+                break
+        tables.append(table)
+    return masks, tables
+
+
+ROOK_MASKS, ROOK_ATTACK_TABLE = _build_slider_tables(_ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_ATTACK_TABLE = _build_slider_tables(_BISHOP_DIRECTIONS)
+
+# Full-length ray masks per direction, for carving falcon/hunter moves out
+# of the rook and bishop attack sets one ray at a time.
+RAY_MASKS = {direction: [_slider_attacks(sq, [direction], 0)
+                         for sq in range(64)]
+             for direction in _ROOK_DIRECTIONS + _BISHOP_DIRECTIONS}
+
+# Signed piece codes for the flat square array: positive white, negative
+# black, 0 for an empty square.
+PIECE_CODES = {'P': 1, 'N': 2, 'B': 3, 'R': 4, 'Q': 5, 'K': 6, 'F': 7, 'H': 8}
+SYMBOL_TO_CODE = {}
+CODE_TO_SYMBOL = {0: '.'}
+for _symbol, _code in PIECE_CODES.items():
+    SYMBOL_TO_CODE[_symbol] = _code
+    SYMBOL_TO_CODE[_symbol.lower()] = -_code
+    CODE_TO_SYMBOL[_code] = _symbol
+    CODE_TO_SYMBOL[-_code] = _symbol.lower()
+
+def _fairy_flag(piece):
+    '''
+    Returns the placed-flag bit for a fairy piece symbol: bit 0 for the
+    falcon, bit 1 for the hunter.
+    Parameters:
+        piece(str): 'F', 'H', 'f', or 'h'
+    '''
+    return 1 << (abs(SYMBOL_TO_CODE[piece]) - PIECE_CODES['F'])
+
+
+def is_major(code):
+    '''
+    Returns True if the signed piece code is a major piece (N, B, R, or Q,
+    codes 2..5 either sign).
+    Parameters:
+        code(int): signed piece code
+    '''
+    return 2 <= abs(code) <= 5
+
+
+START_POSITION = {
+    'a8': 'r', 'b8': 'n', 'c8': 'b', 'd8': 'q', 'e8': 'k', 'f8': 'b', 'g8': 'n', 'h8': 'r',
+    'a7': 'p', 'b7': 'p', 'c7': 'p', 'd7': 'p', 'e7': 'p', 'f7': 'p', 'g7': 'p', 'h7': 'p',
+    'a2': 'P', 'b2': 'P', 'c2': 'P', 'd2': 'P', 'e2': 'P', 'f2': 'P', 'g2': 'P', 'h2': 'P',
+    'a1': 'R', 'b1': 'N', 'c1': 'B', 'd1': 'Q', 'e1': 'K', 'f1': 'B', 'g1': 'N', 'h1': 'R'
+}
+
+# Zobrist keys: one 64-bit key per (piece symbol, square) plus a key toggled
+# every move, drawn from a fixed seed so hashes repeat across runs.
+_zobrist_rng = random.Random(162)
+ZOBRIST = {symbol: [_zobrist_rng.getrandbits(64) for _ in range(64)]
+           for symbol in 'PNBRQKFHpnbrqkfh'}
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+
+
+def _build_pawn_tables(white):
+    '''
+    Builds the single-push, double-push, and capture tables for one side's
+    pawns. Each entry is a bitboard; double pushes are only set on the
+    side's starting rank.
+    Parameters:
+        white(bool): True for the white tables
+    Returns:
+        tuple: (pushes, double_pushes, captures), each a list of 64 bitboards
+    '''
+    pushes = [0] * 64
+    double_pushes = [0] * 64
+    captures = [0] * 64
+    step = 8 if white else -8
+    start_rank = 1 if white else 6
+    for sq in range(64):
+        rank, file = divmod(sq, 8)
+        target = sq + step
+        if 0 <= target < 64:
+            pushes[sq] = 1 << target
+            if file > 0:
+                captures[sq] |= 1 << (target - 1)
+            if file < 7:
+                captures[sq] |= 1 << (target + 1)
+        if rank == start_rank:
+            double_pushes[sq] = 1 << (sq + 2 * step)
+    return pushes, double_pushes, captures
+
+
+PAWN_PUSH_WHITE, PAWN_DOUBLE_PUSH_WHITE, PAWN_CAPTURES_WHITE = \
+    _build_pawn_tables(True)
+PAWN_PUSH_BLACK, PAWN_DOUBLE_PUSH_BLACK, PAWN_CAPTURES_BLACK = \
+    _build_pawn_tables(False)
+
+
+def pawn_attacks(sq, white, occupied, opponent_occ):
+    '''
+    Returns the pawn move bitboard: single push, double push from the
+    starting rank (both squares empty), and diagonal captures.
+    Parameters:
+        sq(int): square index 0..63
+        white(bool): True for a white pawn
+        occupied(int): occupancy bitboard of both sides
+        opponent_occ(int): occupancy bitboard of the opposing side
+    Returns:
+        int: bitboard of reachable squares
+    '''
+    if white:
+        push = PAWN_PUSH_WHITE[sq] & ~occupied
+        moves = push | (PAWN_CAPTURES_WHITE[sq] & opponent_occ)
+        if push:
+            moves |= PAWN_DOUBLE_PUSH_WHITE[sq] & ~occupied
+    else:
+        push = PAWN_PUSH_BLACK[sq] & ~occupied
+        moves = push | (PAWN_CAPTURES_BLACK[sq] & opponent_occ)
+        if push:
+            moves |= PAWN_DOUBLE_PUSH_BLACK[sq] & ~occupied
+    return moves
+
+
+def rook_attacks(sq, occupied, _masks=ROOK_MASKS, _table=ROOK_ATTACK_TABLE):
+    '''
+    Returns the rook attack bitboard from a square given the occupancy.
+    The trailing defaults bind the tables at definition time so lookups
+    are local-variable loads instead of global loads.
+    Parameters:
+        sq(int): square index 0..63
+        occupied(int): occupancy bitboard of both sides
+    Returns:
+        int: attack bitboard (own pieces not yet filtered out)
+    '''
+    return _table[sq][occupied & _masks[sq]]
+
+
+def bishop_attacks(sq, occupied, _masks=BISHOP_MASKS,
+                   _table=BISHOP_ATTACK_TABLE):
+    '''
+    Returns the bishop attack bitboard from a square given the occupancy.
+    The trailing defaults bind the tables at definition time so lookups
+    are local-variable loads instead of global loads.
+    Parameters:
+        sq(int): square index 0..63
+        occupied(int): occupancy bitboard of both sides
+    Returns:
+        int: attack bitboard (own pieces not yet filtered out)
+    '''
+    return _table[sq][occupied & _masks[sq]]
+
+
+def queen_attacks(sq, occupied, _rook_masks=ROOK_MASKS,
+                  _rook_table=ROOK_ATTACK_TABLE, _bishop_masks=BISHOP_MASKS,
+                  _bishop_table=BISHOP_ATTACK_TABLE):
+    '''
+    Returns the queen attack bitboard from a square given the occupancy.
+    The trailing defaults bind the tables at definition time so lookups
+    are local-variable loads instead of global loads.
+    Parameters:
+        sq(int): square index 0..63
+        occupied(int): occupancy bitboard of both sides
+    Returns:
+        int: attack bitboard (own pieces not yet filtered out)
+    '''
+    return (_rook_table[sq][occupied & _rook_masks[sq]]
+            | _bishop_table[sq][occupied & _bishop_masks[sq]])
+
+
+# Combined relevant-blocker masks for the falcon/hunter cache: occupancy
+# outside a square's rook and bishop masks can never change the attack set,
+# so it is stripped before the memoized lookup.
+_SLIDER_MASKS = [ROOK_MASKS[sq] | BISHOP_MASKS[sq] for sq in range(64)]
+
+
+def falcon_attacks(sq, white, occupied):
+    '''
+    Returns the falcon attack bitboard: forward diagonals plus a backward
+    straight ray, carved out of the rook and bishop attack sets (a slider's
+    rays are independent of each other).
+    Parameters:
+        sq(int): square index 0..63
+        white(bool): True for a white falcon
+        occupied(int): occupancy bitboard of both sides
+    Returns:
+        int: attack bitboard (own pieces not yet filtered out)
+    '''
+    return _falcon_attacks_masked(sq, white, occupied & _SLIDER_MASKS[sq])
+
+
+@lru_cache(maxsize=None)
+def _falcon_attacks_masked(sq, white, masked_occ):
+    '''
+    Memoized falcon attack computation. Safe to cache because the masked
+    occupancy fully determines the result.
+    '''
+    occupied = masked_occ
+    if white:
+        straight, diagonals = (-1, 0), ((1, 1), (1, -1))
+    else:
+        straight, diagonals = (1, 0), ((-1, -1), (-1, 1))
+    attacks = (ROOK_ATTACK_TABLE[sq][occupied & ROOK_MASKS[sq]]
+               & RAY_MASKS[straight][sq])
+    diag_attacks = BISHOP_ATTACK_TABLE[sq][occupied & BISHOP_MASKS[sq]]
+    for diagonal in diagonals:
+        attacks |= diag_attacks & RAY_MASKS[diagonal][sq]
+    return attacks
+
+
+def hunter_attacks(sq, white, occupied):
+    '''
+    Returns the hunter attack bitboard: mirror of the falcon, a forward
+    straight ray plus backward diagonals.
+    Parameters:
+        sq(int): square index 0..63
+        white(bool): True for a white hunter
+        occupied(int): occupancy bitboard of both sides
+    Returns:
+        int: attack bitboard (own pieces not yet filtered out)
+    '''
+    return _hunter_attacks_masked(sq, white, occupied & _SLIDER_MASKS[sq])
+
+
+@lru_cache(maxsize=None)
+def _hunter_attacks_masked(sq, white, masked_occ):
+    '''
+    Memoized hunter attack computation. Safe to cache because the masked
+    occupancy fully determines the result.
+    '''
+    occupied = masked_occ
+    if white:
+        straight, diagonals = (1, 0), ((-1, -1), (-1, 1))
+    else:
+        straight, diagonals = (-1, 0), ((1, -1), (1, 1))
+    attacks = (ROOK_ATTACK_TABLE[sq][occupied & ROOK_MASKS[sq]]
+               & RAY_MASKS[straight][sq])
+    diag_attacks = BISHOP_ATTACK_TABLE[sq][occupied & BISHOP_MASKS[sq]]
+    for diagonal in diagonals:
+        attacks |= diag_attacks & RAY_MASKS[diagonal][sq]
+    return attacks
+
+
+# Uniform (sq, white, own_occ, opponent_occ) -> move bitboard wrappers, so
+# move validation can dispatch on the piece symbol without building a piece
+# object per call.
+def _pawn_moves(sq, white, own_occ, opponent_occ):
+    return pawn_attacks(sq, white, own_occ | opponent_occ, opponent_occ)
+
+
+def _knight_moves(sq, white, own_occ, opponent_occ, _table=KNIGHT_ATTACKS):
+    return _table[sq] & ~own_occ
+
+
+def _bishop_moves(sq, white, own_occ, opponent_occ):
+    return bishop_attacks(sq, own_occ | opponent_occ) & ~own_occ
+
+
+def _rook_moves(sq, white, own_occ, opponent_occ):
+    return rook_attacks(sq, own_occ | opponent_occ) & ~own_occ
+
+
+def _queen_moves(sq, white, own_occ, opponent_occ):
+    return queen_attacks(sq, own_occ | opponent_occ) & ~own_occ
+
+
+def _king_moves(sq, white, own_occ, opponent_occ, _table=KING_ATTACKS):
+    return _table[sq] & ~own_occ
+
+
+def _falcon_moves(sq, white, own_occ, opponent_occ):
+    return falcon_attacks(sq, white, own_occ | opponent_occ) & ~own_occ
+
+
+def _hunter_moves(sq, white, own_occ, opponent_occ):
+    return hunter_attacks(sq, white, own_occ | opponent_occ) & ~own_occ
+
+
+_ATTACK_FN = {
+    'P': _pawn_moves,
+    'N': _knight_moves,
+    'B': _bishop_moves,
+    'R': _rook_moves,
+    'Q': _queen_moves,
+    'K': _king_moves,
+    'F': _falcon_moves,
+    'H': _hunter_moves,
+}
+
+
+def _build_startpos_moves():
+    '''
+    Computes the Zobrist hash of the starting position and the fixed set of
+    legal (start, end) moves white has there. Any board whose hash matches
+    can answer move validation by set membership alone.
+    Returns:
+        tuple: (int hash, frozenset of (start, end) square pairs)
+    '''
+    position_hash = 0
+    occ_white = 0
+    occ_black = 0
+    codes = [0] * 64
+    for square, symbol in START_POSITION.items():
+        bit_index = SQUARE_TO_BIT[square]
+        codes[bit_index] = SYMBOL_TO_CODE[symbol]
+        position_hash ^= ZOBRIST[symbol][bit_index]
+        if SYMBOL_TO_CODE[symbol] > 0:
+            occ_white |= 1 << bit_index
+        else:
+            occ_black |= 1 << bit_index
+    moves = set()
+    for sq, code in enumerate(codes):
+        if code <= 0:
+            continue
+        attack_fn = _ATTACK_FN[CODE_TO_SYMBOL[code].upper()]
+        for target in iter_bits(attack_fn(sq, True, occ_white, occ_black)):
+            moves.add((BIT_TO_SQUARE[sq], BIT_TO_SQUARE[target]))
+    return position_hash, frozenset(moves)
+
+
+STARTPOS_HASH, STARTPOS_MOVES = _build_startpos_moves()
+
+
 class ChessVar:
     '''
     Handles the playing of the game. Contains methods for getting turn, 
     switching turns, making moves, entering a fairy piece, and getting the game 
     state. Initiates the Board subclass when called.
     '''
+    __slots__ = ('_game_state', '_turn', '_board')
+
     def __init__(self):
         '''
         Initialize the game state and turn(begin with white). Creates the board.
@@ -31,35 +473,54 @@ class ChessVar:
         Returns:
             bool: True if the move is valid and made, False otherwise.
         '''  
-        board = self._board.get_board()
-        if start not in board or end not in board:
+        if start not in SQUARE_TO_BIT or end not in SQUARE_TO_BIT:
+            return False
+        # Bind the board and square indices once; this method is the hot
+        # path for batched play and repeated method calls add up.
+        board = self._board
+        start_index = SQUARE_TO_BIT[start]
+        end_index = SQUARE_TO_BIT[end]
+        # In the opening position (hash match covers repetitions too) the
+        # legal moves are a fixed set, so skip validation entirely.
+        if board.get_hash() == STARTPOS_HASH:
+            if (start, end) in STARTPOS_MOVES:
+                self.switch_turn()
+                board._apply_move(
+                    CODE_TO_SYMBOL[board.get_square_code(start_index)],
+                    start, end)
+                return True
+            return False
+        start_code = board.get_square_code(start_index)
+        if start_code == 0:
             return False
-        piece_symbol = board[start]
-        piece_color = 'white' if piece_symbol.isupper() else 'black'
-        piece_class = self._board.get_piece_mapping().get(piece_symbol.upper())
+        piece_symbol = CODE_TO_SYMBOL[start_code]
+        piece_color = 'white' if start_code > 0 else 'black'
+        attack_fn = _ATTACK_FN.get(piece_symbol.upper())
 
-        if self.get_game_state() in ['WHITE_WON', 'BLACK_WON']:
+        if self._game_state != 'UNFINISHED':
             return False
-        if ((piece_color == 'white' and self._turn == 'black') 
-                or (piece_color == 'black' and self._turn == 'white')):
+        if piece_color != self._turn:
             return False
-        if piece_class:
-            piece = piece_class(start, piece_color, self._board)
-            if piece.is_valid_move(start, end) == True:
-                if board[end] == 'K':
-                    self._board.update_board(piece_symbol, start, end)
+        if attack_fn:
+            opponent = 'black' if piece_color == 'white' else 'white'
+            moves = attack_fn(start_index, piece_color == 'white',
+                              board.get_occupancy(piece_color),
+                              board.get_occupancy(opponent))
+            if (moves >> end_index) & 1:
+                end_code = board.get_square_code(end_index)
+                if end_code == PIECE_CODES['K']:
+                    board._apply_move(piece_symbol, start, end)
                     self._game_state = 'BLACK_WON'
                     print(self._game_state)
                     return True
-                if board[end] == 'k':
-                    self._board.update_board(piece_symbol, start, end)
+                if end_code == -PIECE_CODES['K']:
+                    board._apply_move(piece_symbol, start, end)
                     self._game_state = 'WHITE_WON'
                     print(self._game_state)
                     return True
-                if self._game_state == 'UNFINISHED':
-                    self.switch_turn()
-                    self._board.update_board(piece_symbol, start, end)
-                    return True   
+                self.switch_turn()
+                board._apply_move(piece_symbol, start, end)
+                return True
         return False
 
     def get_game_state(self):
@@ -81,17 +542,16 @@ class ChessVar:
         Returns:
             bool: True if the fairy piece is successfully placed, False otherwise.
         '''
-        board = self._board.get_board()
-        pieces = self._board.get_piece_mapping()
-        if square not in board:
+        if square not in SQUARE_TO_BIT:
             return False
-        if piece not in pieces:
+        # Only the falcon and hunter enter play by placement
+        if piece not in ('F', 'H', 'f', 'h'):
             return False
 
-        piece_color = 'white' if piece.isupper() else 'black'
-        lost_pieces = self._board.get_lost_major_pieces(piece_color)
-        fairy_pieces_placed = self._board.get_fairy_piece_status(piece_color)
-        if piece in fairy_pieces_placed:
+        piece_color = 'white' if SYMBOL_TO_CODE[piece] > 0 else 'black'
+        lost_count = self._board.get_lost_major_pieces(piece_color)
+        fairy_placed = self._board.get_fairy_piece_status(piece_color)
+        if fairy_placed & _fairy_flag(piece):
             return False
                     
         if self._turn != piece_color:
@@ -103,17 +563,24 @@ class ChessVar:
             return False
 
         # Check if the square is empty
-        if board[square] != '.':
+        if self._board.get_square_code(SQUARE_TO_BIT[square]) != 0:
             return False
         
-        if len(lost_pieces) < 1 or (len(fairy_pieces_placed) >= 1 and len(lost_pieces) < 2):
+        if lost_count < 1 or (popcount(fairy_placed) >= 1 and lost_count < 2):
             return False
 
         self.switch_turn()
-        self._board.update_board(piece, None, square)
+        self._board._apply_move(piece, None, square)
         self._board.register_fairy_piece_placement(piece, piece_color)
         return True
 
+    def show_board(self):
+        '''
+        Prints the current board. Used by the interactive terminal loop,
+        which owns display now that moves no longer reprint the board.
+        '''
+        self._board.print_board()
+
     def switch_turn(self):
         '''
         Called whenever a move is made. Changes whose turn it is.  
@@ -129,6 +596,10 @@ class Board:
     Represents the chess board with dictionaries for piece tracking as well as
     methods for printing in the terminal. 
     '''
+    __slots__ = ('_chess_var', '_squares', '_bb', '_occ_white', '_occ_black',
+                 '_zobrist', '_board_view', '_lost_major_pieces',
+                 '_fairy_pieces_placed', '_piece_mapping', '_pieces')
+
     def __init__(self, chess_var):
         '''
         Initializes the board with the starting position of pieces.
@@ -136,18 +607,25 @@ class Board:
             chess_var(class): chess_var class
         '''
         self._chess_var = chess_var 
-        self._board = {
-            'a8': 'r', 'b8': 'n', 'c8': 'b', 'd8': 'q', 'e8': 'k', 'f8': 'b', 'g8': 'n', 'h8': 'r',
-            'a7': 'p', 'b7': 'p', 'c7': 'p', 'd7': 'p', 'e7': 'p', 'f7': 'p', 'g7': 'p', 'h7': 'p',
-            'a6': '.', 'b6': '.', 'c6': '.', 'd6': '.', 'e6': '.', 'f6': '.', 'g6': '.', 'h6': '.',
-            'a5': '.', 'b5': '.', 'c5': '.', 'd5': '.', 'e5': '.', 'f5': '.', 'g5': '.', 'h5': '.',
-            'a4': '.', 'b4': '.', 'c4': '.', 'd4': '.', 'e4': '.', 'f4': '.', 'g4': '.', 'h4': '.',
-            'a3': '.', 'b3': '.', 'c3': '.', 'd3': '.', 'e3': '.', 'f3': '.', 'g3': '.', 'h3': '.',
-            'a2': 'P', 'b2': 'P', 'c2': 'P', 'd2': 'P', 'e2': 'P', 'f2': 'P', 'g2': 'P', 'h2': 'P',
-            'a1': 'R', 'b1': 'N', 'c1': 'B', 'd1': 'Q', 'e1': 'K', 'f1': 'B', 'g1': 'N', 'h1': 'R'
-        }
-        self._lost_major_pieces = {'white': [], 'black': []}
-        self._fairy_pieces_placed = {'white': [], 'black': []}
+        self._squares = array.array('b', [0] * 64)
+        self._bb = {symbol: 0 for symbol in 'PNBRQKFHpnbrqkfh'}
+        self._occ_white = 0
+        self._occ_black = 0
+        self._zobrist = 0
+        for square, symbol in START_POSITION.items():
+            bit_index = SQUARE_TO_BIT[square]
+            self._squares[bit_index] = SYMBOL_TO_CODE[symbol]
+            self._zobrist ^= ZOBRIST[symbol][bit_index]
+            bit = 1 << bit_index
+            self._bb[symbol] |= bit
+            if SYMBOL_TO_CODE[symbol] > 0:
+                self._occ_white |= bit
+            else:
+                self._occ_black |= bit
+        self._board_view = None  # Lazy square-to-symbol dict for display
+        self._lost_major_pieces = {'white': 0, 'black': 0}
+        # Bit flags per fairy piece placed: bit 0 falcon, bit 1 hunter
+        self._fairy_pieces_placed = {'white': 0, 'black': 0}
         self._piece_mapping = {
             'P': Pawn,
             'p': Pawn,
@@ -207,68 +685,129 @@ class Board:
         bottom_border = "  ╚═══╧═══╧═══╧═══╧═══╧═══╧═══╧═══╝"
         row_start = "║"
         row_end = "║"
+        buf = []
         if self._chess_var.get_turn() == 'white':
-            print("White's turn")
+            buf.append("White's turn\n")
         else:
-            print("Black's turn")
-        print('') 
-        print(top_border)
+            buf.append("Black's turn\n")
+        buf.append('\n')
+        buf.append(top_border + '\n')
+        board = self.get_board()
         for row_number in range(8, 0, -1):
-            print(f'{row_number} {row_start}', end='')
+            buf.append(f'{row_number} {row_start}')
             for col_letter in 'abcdefgh':
                 square = col_letter + str(row_number)
-                piece = self._board.get(square, '.')  #
-                print(f' {self._pieces[piece]} │', end='')
-            print(f'\b{row_end}')  
+                piece = board.get(square, '.')  #
+                buf.append(f' {self._pieces[piece]} │')
+            buf.append(f'\b{row_end}\n')
             if row_number > 1:
-                print(middle_border)
+                buf.append(middle_border + '\n')
             else:
-                print(bottom_border)
-        print('    a   b   c   d   e   f   g   h  ')
-        print('') 
+                buf.append(bottom_border + '\n')
+        buf.append('    a   b   c   d   e   f   g   h  \n')
+        buf.append('\n')
+        sys.stdout.write(''.join(buf))
 
     def update_board(self, piece, start: str, end: str):
         '''
-        Updates the board (dictionary) with a new move.
+        Updates the board with a new move and reprints it. Interactive
+        wrapper around _apply_move for terminal play.
         Parameters:
             piece (str): The piece being moved.
             start (str): The starting square of the piece.
             end (str): The ending square of the piece.
         '''
-        if self._board[end] != '.':
-            captured_piece = self._board[end]
-            player_color = 'white' if captured_piece.isupper() else 'black'
-            if captured_piece in 'QRBNqrbn':  # It's a major piece
-                self._lost_major_pieces[player_color].append(captured_piece)
+        self._apply_move(piece, start, end)
+        self.print_board()
+
+    def _apply_move(self, piece, start, end):
+        '''
+        Applies a move to the board state (square array, bitboards, lost
+        pieces) without any display work.
+        Parameters:
+            piece (str): The piece being moved.
+            start (str): The starting square, or None for a new placement.
+            end (str): The ending square of the piece.
+        '''
+        piece_code = SYMBOL_TO_CODE[piece]
+        piece_color = 'white' if piece_code > 0 else 'black'
+        end_index = SQUARE_TO_BIT[end]
+        end_bit = 1 << end_index
+        captured_code = self._squares[end_index]
+        if captured_code:
+            captured_piece = CODE_TO_SYMBOL[captured_code]
+            player_color = 'white' if captured_code > 0 else 'black'
+            if is_major(captured_code):
+                self._lost_major_pieces[player_color] += 1
+            self._bb[captured_piece] ^= end_bit  # Remove the captured piece
+            self._zobrist ^= ZOBRIST[captured_piece][end_index]
+            if player_color == 'white':
+                self._occ_white ^= end_bit
+            else:
+                self._occ_black ^= end_bit
 
         if start:
-            self._board[start] = '.'  # Clear the starting square if it's not a new placement
-        self._board[end] = piece  # Place or move the piece to the ending square
-        self.print_board()
+            start_index = SQUARE_TO_BIT[start]
+            self._squares[start_index] = 0  # Clear the starting square if it's not a new placement
+            start_bit = 1 << start_index
+            self._bb[piece] ^= start_bit
+            self._zobrist ^= ZOBRIST[piece][start_index]
+            if piece_color == 'white':
+                self._occ_white ^= start_bit
+            else:
+                self._occ_black ^= start_bit
+        self._squares[end_index] = piece_code  # Place or move the piece
+        self._zobrist ^= ZOBRIST[piece][end_index] ^ ZOBRIST_SIDE
+        self._bb[piece] |= end_bit
+        if piece_color == 'white':
+            self._occ_white |= end_bit
+        else:
+            self._occ_black |= end_bit
+        self._board_view = None  # Cached display view is stale
 
     def get_lost_major_pieces(self, color):
         '''
-        Return a list of lost major pieces for the given color.
+        Return the count of lost major pieces for the given color.
         '''
         return self._lost_major_pieces[color]
 
     def register_fairy_piece_placement(self, piece, color):
         '''
-        Increment the count of fairy pieces placed for the given color.
+        Set the placed flag of the given fairy piece for the given color.
         '''
-        self._fairy_pieces_placed[color].append(piece)
+        self._fairy_pieces_placed[color] |= _fairy_flag(piece)
 
     def get_fairy_piece_status(self, color):
         '''
-        Return the number of fairy pieces placed for the given color.
+        Return the fairy-pieces-placed bit flags for the given color.
         '''
         return self._fairy_pieces_placed[color]
 
     def get_board(self):
         '''
-        Returns the board dictionary.
+        Returns the board as a square-to-symbol dictionary. Built lazily
+        from the flat square array and cached until the next move.
+        '''
+        if self._board_view is None:
+            self._board_view = {BIT_TO_SQUARE[sq]: CODE_TO_SYMBOL[code]
+                                for sq, code in enumerate(self._squares)}
+        return self._board_view
+
+    def get_hash(self):
+        '''
+        Returns the Zobrist hash of the current position. Equal positions
+        with the same side to move hash equal, so the value can key
+        repetition checks or move caches in O(1).
+        '''
+        return self._zobrist
+
+    def get_square_code(self, sq):
+        '''
+        Returns the signed piece code on a square index (0 if empty).
+        Parameters:
+            sq(int): square index 0..63
         '''
-        return self._board
+        return self._squares[sq]
 
     def get_piece_mapping(self):
         '''
@@ -276,27 +815,20 @@ class Board:
         '''
         return self._piece_mapping
 
-    def get_opponent_pieces(self, color):
+    def get_occupancy(self, color):
         '''
-        Returns list of opponent pieces.
+        Returns the occupancy bitboard for the given color.
         Parameters:
-            color(str): The color of your side.
+            color(str): 'white' or 'black'
         '''
-        opponent_pieces = []
-        if color == 'white':
-            for pos, piece in self._board.items(): 
-                if piece.islower():
-                    opponent_pieces.append((pos, piece))
-        else:
-            for pos, piece in self._board.items(): 
-                if piece.isupper():
-                    opponent_pieces.append((pos, piece))
-        return opponent_pieces
+        return self._occ_white if color == 'white' else self._occ_black
 
 class Pawn:
     '''
     Represents a pawn piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the pawn with its position and color.
@@ -316,28 +848,21 @@ class Pawn:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = pos[1], pos[0]
-        forward_row = str(int(row)+ 1) if self._color == 'white' else str(int(row)- 1)
-        forward_pos = col + forward_row
-        #forward
-        if self._board.get_board().get(forward_pos, None) == '.':
-            valid_moves.append(forward_pos)
-
-            #double forward
-            if (self._color == 'white' and row == '2') or (self._color == 'black' and row == '7'):
-                double_forward_row = str(int(row)+ 2) if self._color == 'white' else str(int(row)- 2)
-                double_forward_pos = col + double_forward_row
-                if self._board.get_board().get(double_forward_pos, None) == '.':
-                    valid_moves.append(double_forward_pos)
-
-        #capture
-        for capture_col in [chr(ord(col)-1), chr(ord(col)+ 1)]: #ascii to check adjacent columns
-            capture_pos = capture_col + forward_row
-            if any(pos == capture_pos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                valid_moves.append(capture_pos)
-        
-        return valid_moves
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
+
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the pawn on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _pawn_moves(sq, self._color == 'white',
+                           self._board.get_occupancy(self._color),
+                           self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -348,14 +873,15 @@ class Pawn:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1)
 
 class Rook:
     '''
     Represents a rook piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the rook with its position and color.
@@ -375,24 +901,21 @@ class Rook:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = int(pos[1]), pos[0]  
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-
-        for direction in directions:
-            for index in range(1, 8):  # Maximum number of squares in any direction
-                newRow = row + direction[0] * index
-                newCol = ord(col) + direction[1] * index
-                if newRow in range(1, 9) and newCol in range(ord('a'), ord('h') + 1):
-                    newPos = chr(newCol) + str(newRow)
-                    if self._board.get_board().get(newPos, None) == '.':
-                        valid_moves.append(newPos)
-                    else:
-                        if any(newPos == pos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                            valid_moves.append(newPos)
-                        break  # Stop checking further in this direction
-            
-        return valid_moves
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
+
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the rook on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _rook_moves(sq, self._color == 'white',
+                           self._board.get_occupancy(self._color),
+                           self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -403,14 +926,15 @@ class Rook:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1)
 
 class Knight:
     '''
     Represents a knight piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the knight with its position and color.
@@ -431,22 +955,21 @@ class Knight:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = int(pos[1]), pos[0]  
-        moves = [(2, 1), (2, -1), (-2, 1), (-2, -1),
-                 (1, 2), (1, -2), (-1, 2), (-1, -2)]
-        for move in moves:
-            newRow = row + move[0] 
-            newCol = ord(col) + move[1] 
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
 
-            if newRow in range(1, 9) and newCol in range(ord('a'), ord('h') + 1):
-                newPos = chr(newCol) + str(newRow)
-                if self._board.get_board().get(newPos, None) == '.':
-                        valid_moves.append(newPos)
-                elif any(pos == newPos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                    valid_moves.append(newPos)
-
-        return valid_moves
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the knight on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _knight_moves(sq, self._color == 'white',
+                             self._board.get_occupancy(self._color),
+                             self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -457,14 +980,15 @@ class Knight:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1)
 
 class Bishop:
     '''
     Represents a bishop piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the bishop with its position and color.
@@ -485,26 +1009,21 @@ class Bishop:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = int(pos[1]), pos[0]  
-         # Directions: Diagonally Up-Left, Up-Right, Down-Left, Down-Right
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-
-        for direction in directions:
-            for index in range(1, 8):  
-                newRow = row + direction[0] * index
-                newCol = ord(col) + direction[1] * index
-                
-                if newRow in range(1, 9) and newCol in range(ord('a'), ord('h') + 1):
-                    newPos = chr(newCol) + str(newRow)
-                    if self._board.get_board().get(newPos, None) == '.':
-                        valid_moves.append(newPos)
-                    else:
-                        if any(newPos == pos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                            valid_moves.append(newPos)
-                        break  # Stop checking further in this direction
-            
-        return valid_moves
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
+
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the bishop on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _bishop_moves(sq, self._color == 'white',
+                             self._board.get_occupancy(self._color),
+                             self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -515,14 +1034,15 @@ class Bishop:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1)
 
 class Queen:
     '''
     Represents a queen piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the queen with its position and color.
@@ -543,26 +1063,21 @@ class Queen:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = int(pos[1]), pos[0]  
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1), 
-                      (-1, -1), (-1, 1), (1, -1), (1, 1)]
-
-        for direction in directions:
-            for index in range(1, 8):
-                newRow = row + direction[0] * index
-                newCol = ord(col) + direction[1] * index
-                
-                if newRow in range(1, 9) and newCol in range(ord('a'), ord('h') + 1):
-                    newPos = chr(newCol) + str(newRow)
-                    if self._board.get_board().get(newPos, None) == '.':
-                        valid_moves.append(newPos)
-                    else:
-                        if any(newPos == pos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                            valid_moves.append(newPos)
-                        break  # Stop checking further in this direction
-            
-        return valid_moves
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
+
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the queen on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _queen_moves(sq, self._color == 'white',
+                            self._board.get_occupancy(self._color),
+                            self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -573,14 +1088,15 @@ class Queen:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1)
 
 class King:
     '''
     Represents a king piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the king with its position and color.
@@ -601,23 +1117,21 @@ class King:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = int(pos[1]), pos[0]  
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1), 
-                    (-1, -1), (-1, 1), (1, -1), (1, 1)]
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
 
-        for direction in directions:
-            newRow = row + direction[0]
-            newCol = ord(col) + direction[1]
-
-            if newRow in range(1, 9) and newCol in range(ord('a'), ord('h') + 1):
-                newPos = chr(newCol) + str(newRow)
-                if self._board.get_board().get(newPos, None) == '.':
-                        valid_moves.append(newPos)
-                elif any(pos == newPos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                    valid_moves.append(newPos)
-    
-        return valid_moves
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the king on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _king_moves(sq, self._color == 'white',
+                           self._board.get_occupancy(self._color),
+                           self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -628,14 +1142,15 @@ class King:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False 
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1) 
 
 class Falcon:
     '''
     Represents a falcon piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the falcon with its position and color.
@@ -656,28 +1171,21 @@ class Falcon:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = int(pos[1]), pos[0]  
-        if self._color == 'white':
-            directions = [(-1, 0), (1, 1), (1, -1)] 
-        if self._color == 'black':
-            directions = [(1, 0), (-1, -1), (-1, 1)] 
-
-        for direction in directions:
-            for index in range(1, 8):  
-                newRow = row + direction[0] * index
-                newCol = ord(col) + direction[1] * index
-                
-                if newRow in range(1, 9) and newCol in range(ord('a'), ord('h') + 1):
-                    newPos = chr(newCol) + str(newRow)
-                    if self._board.get_board().get(newPos, None) == '.':
-                        valid_moves.append(newPos)
-                    else:
-                        if any(newPos == pos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                            valid_moves.append(newPos)
-                        break  
-            
-        return valid_moves
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
+
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the falcon on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _falcon_moves(sq, self._color == 'white',
+                             self._board.get_occupancy(self._color),
+                             self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -688,14 +1196,15 @@ class Falcon:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1)
 
 class Hunter:
     '''
     Represents a hunter piece and its movement rules.
     '''
+    __slots__ = ('_position', '_color', '_board')
+
     def __init__(self, pos, color, board):
         '''
         Initializes the hunter with its position and color.
@@ -716,28 +1225,21 @@ class Hunter:
         Returns:
             list[str]: A list of valid moves (e.g., ['e3', 'e4']).
         '''
-        valid_moves = []
-        row, col = int(pos[1]), pos[0]  
-        if self._color == 'white':
-            directions = [(1, 0), (-1, -1), (-1, 1)] 
-        if self._color == 'black':
-            directions = [(-1, 0), (1, -1), (1, 1)]   
-
-        for direction in directions:
-            for index in range(1, 8):  
-                newRow = row + direction[0] * index
-                newCol = ord(col) + direction[1] * index
-                
-                if newRow in range(1, 9) and newCol in range(ord('a'), ord('h') + 1):
-                    newPos = chr(newCol) + str(newRow)
-                    if self._board.get_board().get(newPos, None) == '.':
-                        valid_moves.append(newPos)
-                    else:
-                        if any(newPos == pos for pos, _ in self._board.get_opponent_pieces(self._color)):
-                            valid_moves.append(newPos)
-                        break  
-        
-        return valid_moves
+        return [BIT_TO_SQUARE[sq]
+                for sq in iter_bits(self._attacks(SQUARE_TO_BIT[pos]))]
+
+    def _attacks(self, sq):
+        '''
+        Returns the attack bitboard for the hunter on the given square index.
+        Parameters:
+            sq (int): square index 0..63
+        Returns:
+            int: bitboard of reachable squares
+        '''
+        opponent = 'black' if self._color == 'white' else 'white'
+        return _hunter_moves(sq, self._color == 'white',
+                             self._board.get_occupancy(self._color),
+                             self._board.get_occupancy(opponent))
 
     def is_valid_move(self, start: str, end: str):
         '''
@@ -748,9 +1250,8 @@ class Hunter:
         Returns:
             bool: True if the move is valid, False otherwise.
         '''
-        if end in self.get_valid_moves(start):
-            return True
-        return False
+        return bool((self._attacks(SQUARE_TO_BIT[start])
+                     >> SQUARE_TO_BIT[end]) & 1)
 
 
 
@@ -767,4 +1268,5 @@ class Hunter:
 #         if origin in ('f', 'F', 'h', 'H'):
 #             game.enter_fairy_piece(origin, destination)
 #         else:
-#             game.make_move(origin, destination)
\ No newline at end of file
+#             game.make_move(origin, destination)
+#         game.show_board()
\ No newline at end of file